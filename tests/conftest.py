@@ -1 +1,103 @@
 """Pytest configuration for Playwright tests."""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from playwright.sync_api import Browser, BrowserContext, expect
+
+from .settings import BASE_URL, BLOCKED_RESOURCES, HAR_PATH
+
+# Fail fast: the intentionally failing tests otherwise wait out Playwright's
+# 30s action and 5s expect defaults.
+ACTION_TIMEOUT_MS = 3_000
+NAVIGATION_TIMEOUT_MS = 10_000
+
+expect.set_options(timeout=ACTION_TIMEOUT_MS)
+
+# Chromium flags for containerised CI runners (applied when CI is set): avoid
+# the small /dev/shm and skip GPU and background-service start-up. Playwright
+# already launches Chromium without its sandbox by default.
+CHROMIUM_CI_ARGS = (
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-background-networking",
+    "--disable-extensions",
+    "--mute-audio",
+)
+
+
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args: dict, browser_name: str) -> dict:
+    """Add CHROMIUM_CI_ARGS when launching Chromium on CI."""
+    if browser_name != "chromium" or not os.environ.get("CI"):
+        return browser_type_launch_args
+    return {
+        **browser_type_launch_args,
+        "args": [*browser_type_launch_args.get("args", []), *CHROMIUM_CI_ARGS],
+    }
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Runs once on the xdist controller, before any worker starts.
+    if HAR_PATH and not Path(HAR_PATH).is_file():
+        raise pytest.UsageError(f"SAUCEDEMO_HAR is set but {HAR_PATH} does not exist")
+
+
+@pytest.fixture(scope="session")
+def har_path() -> Optional[Path]:
+    """HAR file to serve responses from, or None to hit the network."""
+    return Path(HAR_PATH) if HAR_PATH else None
+
+
+def _route_from_har(context: BrowserContext, har_path: Optional[Path]) -> None:
+    if har_path is not None:
+        context.route_from_har(har_path, not_found="fallback")
+
+
+@pytest.fixture(scope="session")
+def logged_in_state(
+    browser: Browser, tmp_path_factory: pytest.TempPathFactory, har_path: Optional[Path]
+) -> Path:
+    """Log in once per session and save the authenticated storage state."""
+    path = tmp_path_factory.mktemp("auth") / "state.json"
+    context = browser.new_context()
+    _route_from_har(context, har_path)
+    page = context.new_page()
+    page.goto(BASE_URL)
+    page.locator("#user-name").fill("standard_user")
+    page.locator("#password").fill("secret_sauce")
+    page.locator("#login-button").click()
+    page.wait_for_url(f"{BASE_URL}inventory.html")
+    context.storage_state(path=path)
+    context.close()
+    return path
+
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args: dict, logged_in_state: Path) -> dict:
+    """Start every context already logged in."""
+    return {**browser_context_args, "storage_state": logged_in_state}
+
+
+@pytest.fixture
+def block_resources() -> bool:
+    """Abort BLOCKED_RESOURCES requests; override to return False to opt out."""
+    return True
+
+
+@pytest.fixture
+def context(
+    context: BrowserContext, block_resources: bool, har_path: Optional[Path]
+) -> BrowserContext:
+    """Per-test context with short timeouts and unneeded resources blocked."""
+    context.set_default_timeout(ACTION_TIMEOUT_MS)
+    context.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+    # Registered first so the block routes below, which Playwright checks
+    # in reverse order, still take precedence.
+    _route_from_har(context, har_path)
+    if block_resources:
+        for pattern in BLOCKED_RESOURCES:
+            context.route(pattern, lambda route: route.abort())
+    return context
@@ -0,0 +1,22 @@
+"""Settings shared by the conftest fixtures and the test modules."""
+
+import os
+import re
+
+# Point at a local mirror with BASE_URL=http://127.0.0.1:<port>/ to take the
+# WAN out of every navigation.
+BASE_URL = os.environ.get("BASE_URL", "https://www.saucedemo.com/")
+
+# Replay responses from a HAR recorded once with:
+#   playwright open --save-har=saucedemo.har https://www.saucedemo.com/
+# In that session, log in as standard_user and open the inventory and cart
+# pages. Only visited pages are recorded, and anything missing from the HAR
+# quietly falls through to the live site.
+HAR_PATH = os.environ.get("SAUCEDEMO_HAR")
+
+# Images, fonts and trackers that no assertion depends on. Playwright matches
+# compiled patterns with re.search against the full request URL.
+BLOCKED_RESOURCES = (
+    re.compile(r"\.(png|jpe?g|gif|svg|woff2?)(\?.*)?$"),
+    re.compile(r"^https?://([^/]+\.)?(google-analytics\.com|doubleclick\.net)/"),
+)
@@ -0,0 +1,32 @@
+"""Checks for the request patterns aborted by the context fixture."""
+
+import pytest
+
+from .settings import BLOCKED_RESOURCES
+
+
+def is_blocked(url: str) -> bool:
+    return any(pattern.search(url) for pattern in BLOCKED_RESOURCES)
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.google-analytics.com/analytics.js",
+    "https://www.google-analytics.com/g/collect?v=2",
+    "https://stats.g.doubleclick.net/j/collect",
+    "https://www.saucedemo.com/static/media/DMSans.woff2?x=1",
+    "https://www.saucedemo.com/static/media/bike-light.jpg",
+    "https://www.saucedemo.com/favicon.svg",
+])
+def test_blocked(url: str) -> None:
+    assert is_blocked(url)
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.saucedemo.com/",
+    "https://www.saucedemo.com/inventory.html",
+    "https://www.saucedemo.com/static/js/main.js",
+    "https://www.saucedemo.com/static/css/main.css",
+    "https://www.saucedemo.com/?ref=doubleclick.net",
+])
+def test_not_blocked(url: str) -> None:
+    assert not is_blocked(url)
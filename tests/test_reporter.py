@@ -5,12 +5,29 @@ Tests organized by outcome type:
 - Passing, Failing, Skipped, Xfail, Flaky, Parametrized
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterator, List
+
 import pytest
+from filelock import FileLock
 from playwright.sync_api import Page, expect
 
-BASE_URL = "https://www.saucedemo.com/"
+from .settings import BASE_URL
+
+# JPEG encodes faster and is smaller than PNG; Playwright has no WebP output.
+SCREENSHOT_OPTIONS = {"type": "jpeg", "quality": 90}
+
 
+def _write_file(path: Path, data: bytes) -> None:
+    # test-results/ may be removed after setup (pytest-playwright clears its
+    # output dir per worker), so create it at write time.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
 
+
+# The login-page tests check the form as a logged-out user sees it.
+@pytest.mark.browser_context_args(storage_state=None)
 class TestPassing:
     """Tests that pass."""
 
@@ -35,6 +52,7 @@ class TestPassing:
         expect(page).to_have_url(f"{BASE_URL}inventory.html")
 
 
+@pytest.mark.browser_context_args(storage_state=None)
 class TestFailing:
     """Tests that fail - to verify error reporting."""
 
@@ -54,21 +72,14 @@ class TestFailing:
 class TestErrorTypes:
     """Different Python error types."""
 
-    def test_index_error(self, page: Page) -> None:
-        page.goto(BASE_URL)
-        _ = [1, 2][10]
-
-    def test_key_error(self, page: Page) -> None:
-        page.goto(BASE_URL)
-        _ = {}["missing"]
-
-    def test_type_error(self, page: Page) -> None:
-        page.goto(BASE_URL)
-        _ = "str" + 1
-
-    def test_zero_division(self, page: Page) -> None:
-        page.goto(BASE_URL)
-        _ = 1 / 0
+    @pytest.mark.parametrize("action", [
+        lambda: [1, 2][10],
+        lambda: {}["missing"],
+        lambda: "str" + 1,
+        lambda: 1 / 0,
+    ], ids=["index_error", "key_error", "type_error", "zero_division"])
+    def test_error(self, action: Callable[[], object]) -> None:
+        action()
 
 
 class TestSkipped:
@@ -97,21 +108,36 @@ class TestXfail:
         assert True
 
 
-_counter = {}
-
 class TestFlaky:
     """Flaky tests with retries."""
 
+    @pytest.fixture(scope="session")
+    def retry_counter(
+        self, tmp_path_factory: pytest.TempPathFactory, worker_id: str
+    ) -> Path:
+        # Under xdist the parent of the worker basetemp is shared by all
+        # workers of this run; otherwise basetemp itself is per-run.
+        root = tmp_path_factory.getbasetemp()
+        if worker_id != "master":
+            root = root.parent
+        return root / "retry-counter"
+
     @pytest.mark.flaky(reruns=2)
-    def test_passes_on_retry(self, page: Page) -> None:
+    def test_passes_on_retry(self, page: Page, retry_counter: Path) -> None:
         page.goto(BASE_URL)
-        _counter["retry"] = _counter.get("retry", 0) + 1
-        assert _counter["retry"] >= 2
+        with FileLock(retry_counter.with_suffix(".lock")):
+            count = int(retry_counter.read_text()) if retry_counter.exists() else 0
+            count += 1
+            retry_counter.write_text(str(count))
+        assert count >= 2
 
 
 class TestParametrized:
     """Parametrized tests."""
 
+    # Each case drives the login form itself, so start logged out. Only the
+    # context is new per case; the session browser is reused.
+    @pytest.mark.browser_context_args(storage_state=None)
     @pytest.mark.parametrize("user,pwd,ok", [
         ("standard_user", "secret_sauce", True),
         ("locked_out_user", "secret_sauce", False),
@@ -131,9 +157,15 @@ class TestParametrized:
 class TestScreenshots:
     """Screenshot capture tests."""
 
+    @pytest.fixture
+    def block_resources(self) -> bool:
+        # Saved artifacts should show the page as users see it.
+        return False
+
+    @pytest.mark.browser_context_args(storage_state=None)
     def test_capture_screenshot(self, page: Page) -> None:
         page.goto(BASE_URL)
-        page.screenshot(path="test-results/login.png")
+        page.screenshot(path="test-results/login.jpg", **SCREENSHOT_OPTIONS)
         expect(page).to_have_title("Swag Labs")
 
 
@@ -141,18 +173,12 @@ class TestNavigation:
     """Navigation flow tests."""
 
     def test_login_and_cart(self, page: Page) -> None:
-        page.goto(BASE_URL)
-        page.locator("#user-name").fill("standard_user")
-        page.locator("#password").fill("secret_sauce")
-        page.locator("#login-button").click()
+        page.goto(f"{BASE_URL}inventory.html")
         page.locator(".shopping_cart_link").click()
         expect(page).to_have_url(f"{BASE_URL}cart.html")
 
     def test_logout(self, page: Page) -> None:
-        page.goto(BASE_URL)
-        page.locator("#user-name").fill("standard_user")
-        page.locator("#password").fill("secret_sauce")
-        page.locator("#login-button").click()
+        page.goto(f"{BASE_URL}inventory.html")
         page.locator("#react-burger-menu-btn").click()
         page.locator("#logout_sidebar_link").click()
         expect(page).to_have_url(BASE_URL)
@@ -161,84 +187,103 @@ class TestNavigation:
 class TestVisualComparison:
     """Visual/Image comparison tests using Playwright screenshots."""
 
+    @pytest.fixture
+    def block_resources(self) -> bool:
+        # Screenshots need the real product images and fonts.
+        return False
+
+    @pytest.mark.browser_context_args(storage_state=None)
     def test_login_page_full(self, page: Page) -> None:
-        """Capture full page screenshot of login page."""
+        """Capture viewport screenshot of login page."""
         page.goto(BASE_URL)
-        page.wait_for_load_state("networkidle")
-        screenshot = page.screenshot(full_page=True)
+        page.locator(".login_wrapper").wait_for(state="visible")
+        screenshot = page.screenshot(**SCREENSHOT_OPTIONS)
         assert len(screenshot) > 0, "Screenshot should not be empty"
 
+    @pytest.mark.browser_context_args(storage_state=None)
     def test_screenshot_comparison_fail(self, page: Page) -> None:
         """This test intentionally fails to generate screenshot artifacts."""
         page.goto(BASE_URL)
-        page.wait_for_load_state("networkidle")
+        expect(page.locator("#login-button")).to_be_visible()
         # Take screenshot
-        screenshot = page.screenshot()
+        screenshot = page.screenshot(**SCREENSHOT_OPTIONS)
         # Intentionally fail - screenshot size won't match this arbitrary value
         assert len(screenshot) == 12345, f"Screenshot comparison failed: expected 12345 bytes, got {len(screenshot)}"
 
+    @pytest.mark.browser_context_args(storage_state=None)
     def test_login_button_element(self, page: Page) -> None:
         """Capture screenshot of login button element."""
         page.goto(BASE_URL)
         login_button = page.locator("#login-button")
-        screenshot = login_button.screenshot()
+        screenshot = login_button.screenshot(**SCREENSHOT_OPTIONS)
         assert len(screenshot) > 0, "Screenshot should not be empty"
 
+    @pytest.mark.browser_context_args(storage_state=None)
     def test_login_form_element(self, page: Page) -> None:
         """Capture screenshot of the login form container."""
         page.goto(BASE_URL)
         login_form = page.locator(".login_wrapper")
-        screenshot = login_form.screenshot()
+        screenshot = login_form.screenshot(**SCREENSHOT_OPTIONS)
         assert len(screenshot) > 0, "Screenshot should not be empty"
 
     def test_inventory_page_full(self, page: Page) -> None:
-        """Capture full page screenshot after login."""
-        page.goto(BASE_URL)
-        page.locator("#user-name").fill("standard_user")
-        page.locator("#password").fill("secret_sauce")
-        page.locator("#login-button").click()
-        page.wait_for_load_state("networkidle")
-        screenshot = page.screenshot(full_page=True)
+        """Capture viewport screenshot after login."""
+        page.goto(f"{BASE_URL}inventory.html")
+        expect(page.locator(".inventory_list")).to_be_visible()
+        screenshot = page.screenshot(**SCREENSHOT_OPTIONS)
         assert len(screenshot) > 0, "Screenshot should not be empty"
 
     def test_product_card_element(self, page: Page) -> None:
         """Capture screenshot of first product card."""
-        page.goto(BASE_URL)
-        page.locator("#user-name").fill("standard_user")
-        page.locator("#password").fill("secret_sauce")
-        page.locator("#login-button").click()
-        page.wait_for_load_state("networkidle")
+        page.goto(f"{BASE_URL}inventory.html")
+        expect(page.locator(".inventory_list")).to_be_visible()
         first_product = page.locator(".inventory_item").first
-        screenshot = first_product.screenshot()
+        screenshot = first_product.screenshot(**SCREENSHOT_OPTIONS)
         assert len(screenshot) > 0, "Screenshot should not be empty"
 
     def test_header_element(self, page: Page) -> None:
         """Capture screenshot of header after login."""
-        page.goto(BASE_URL)
-        page.locator("#user-name").fill("standard_user")
-        page.locator("#password").fill("secret_sauce")
-        page.locator("#login-button").click()
+        page.goto(f"{BASE_URL}inventory.html")
         header = page.locator(".header_container")
-        screenshot = header.screenshot()
+        screenshot = header.screenshot(**SCREENSHOT_OPTIONS)
         assert len(screenshot) > 0, "Screenshot should not be empty"
 
-    def test_save_screenshots_to_files(self, page: Page) -> None:
+    @pytest.fixture(scope="module")
+    def screenshot_executor(self) -> Iterator[ThreadPoolExecutor]:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            yield executor
+
+    def test_save_screenshots_to_files(
+        self, page: Page, screenshot_executor: ThreadPoolExecutor
+    ) -> None:
         """Save multiple screenshots to test-results folder."""
+        # Files are written in the background while the next step runs.
+        futures: List[Future] = []
+
+        def write_in_background(path: str, data: bytes) -> None:
+            futures.append(screenshot_executor.submit(_write_file, Path(path), data))
+
         page.goto(BASE_URL)
-        page.wait_for_load_state("networkidle")
+        expect(page.locator("#login-button")).to_be_visible()
 
         # Save login page screenshot
-        page.screenshot(path="test-results/visual-login-page.png")
+        screenshot = page.screenshot(**SCREENSHOT_OPTIONS)
+        write_in_background("test-results/visual-login-page.jpg", screenshot)
 
         # Save login button screenshot
-        page.locator("#login-button").screenshot(path="test-results/visual-login-button.png")
+        screenshot = page.locator("#login-button").screenshot(**SCREENSHOT_OPTIONS)
+        write_in_background("test-results/visual-login-button.jpg", screenshot)
 
-        # Login and save inventory page
-        page.locator("#user-name").fill("standard_user")
-        page.locator("#password").fill("secret_sauce")
-        page.locator("#login-button").click()
-        page.wait_for_load_state("networkidle")
-        page.screenshot(path="test-results/visual-inventory-page.png")
+        # Save inventory page (context is already logged in)
+        page.goto(f"{BASE_URL}inventory.html")
+        expect(page.locator(".inventory_list")).to_be_visible()
+        screenshot = page.screenshot(**SCREENSHOT_OPTIONS)
+        write_in_background("test-results/visual-inventory-page.jpg", screenshot)
 
         # Save product card screenshot
-        page.locator(".inventory_item").first.screenshot(path="test-results/visual-product-card.png")
+        screenshot = page.locator(".inventory_item").first.screenshot(**SCREENSHOT_OPTIONS)
+        write_in_background("test-results/visual-product-card.jpg", screenshot)
+
+        # Wait for the writes so a failure is reported by this test.
+        for future in futures:
+            future.result()